@@ -26,11 +26,22 @@ from __future__ import annotations
 
 import sys
 import time
-from argparse import ArgumentParser
+from types import SimpleNamespace
 
 try:
-	from PySide6.QtCore import Qt, QTimer
-	from PySide6.QtGui import QFont, QPalette, QColor, QAction, QIcon
+	from PySide6.QtCore import Qt, QEvent, QPointF, QRectF, QTimer
+	from PySide6.QtGui import (
+		QFont,
+		QFontMetrics,
+		QPalette,
+		QColor,
+		QIcon,
+		QKeySequence,
+		QShortcut,
+		QPainter,
+		QStaticText,
+		QTransform,
+	)
 	from PySide6.QtWidgets import (
 		QApplication,
 		QLabel,
@@ -38,9 +49,9 @@ try:
 		QWidget,
 		QVBoxLayout,
 		QHBoxLayout,
+		QGridLayout,
+		QSizePolicy,
 		QPushButton,
-		QMenu,
-		QMessageBox,
 		QSystemTrayIcon,
 	)
 except ImportError as e:  # Graceful message if dependency missing
@@ -50,14 +61,59 @@ except ImportError as e:  # Graceful message if dependency missing
 
 APP_TITLE = "Steam Play Hours Simulator"
 
+# Applied once at QApplication level so Qt parses it a single time
+STYLE_SHEET = """
+	QMainWindow { background: #121214; }
+	QLabel#CaptionLabel { color: #8b9199; font-size: 11px; letter-spacing: 1px; }
+	QPushButton { background: #1c1f24; color: #e2e5e9; padding: 8px 14px; border: 1px solid #2c313a; border-radius: 6px; font-size: 14px; }
+	QPushButton:hover { background: #2a2f35; }
+	QPushButton:pressed { background: #23272d; }
+	QPushButton:checked { background: #347edb; border-color: #347edb; color: white; }
+	QPushButton:focus { outline: none; border: 1px solid #347edb; }
+"""
+
+# Interned zero-padded strings for every two-digit field value; ticks index
+# into this instead of formatting a fresh string each time
+_TWO_DIGIT = tuple(sys.intern(f"{i:02d}") for i in range(100))
+
+
+def _build_parser():
+	from argparse import ArgumentParser  # Only needed for --help and error reporting
 
-def parse_args():
 	parser = ArgumentParser(description=APP_TITLE)
 	parser.add_argument("--offset-seconds", type=int, default=0, help="Pretend the timer already ran this many seconds.")
 	parser.add_argument("--offset-hours", type=float, default=0.0, help="Pretend the timer already ran this many hours (adds to offset-seconds).")
 	parser.add_argument("--compact", action="store_true", help="Use a more compact window size.")
 	parser.add_argument("--no-accent-pulse", action="store_true", help="Disable subtle accent color pulsing animation.")
-	return parser.parse_args()
+	return parser
+
+
+def parse_args(argv=None):
+	# Hand-rolled fast path for the four known flags; argparse is only built
+	# when something needs its help text or error messages.
+	argv = sys.argv[1:] if argv is None else argv
+	args = SimpleNamespace(offset_seconds=0, offset_hours=0.0, compact=False, no_accent_pulse=False)
+	it = iter(argv)
+	try:
+		for arg in it:
+			name, eq, value = arg.partition("=")
+			if name in ("--offset-seconds", "--offset-hours"):
+				if not eq:
+					value = next(it)
+				if name == "--offset-seconds":
+					args.offset_seconds = int(value)
+				else:
+					args.offset_hours = float(value)
+			elif arg == "--compact":
+				args.compact = True
+			elif arg == "--no-accent-pulse":
+				args.no_accent_pulse = True
+			else:
+				raise ValueError(arg)
+	except (StopIteration, ValueError):
+		# --help, unknown flags or bad values: argparse prints usage and exits
+		return _build_parser().parse_args(argv)
+	return args
 
 
 def format_duration(seconds: int) -> str:
@@ -67,13 +123,137 @@ def format_duration(seconds: int) -> str:
 	return f"{days:02d}:{hours:02d}:{minutes:02d}:{secs:02d}"
 
 
+def pulse_suppressed_by_system() -> bool:
+	# Windows only: honour "Show animations in Windows" being off, and skip the
+	# pulse while running on battery. Other platforms expose no cheap query.
+	if sys.platform != "win32":
+		return False
+	try:
+		import ctypes
+		from ctypes import wintypes
+
+		SPI_GETCLIENTAREAANIMATION = 0x1042
+		animations = wintypes.BOOL(True)
+		if ctypes.windll.user32.SystemParametersInfoW(SPI_GETCLIENTAREAANIMATION, 0, ctypes.byref(animations), 0) and not animations.value:
+			return True
+
+		class SYSTEM_POWER_STATUS(ctypes.Structure):
+			_fields_ = [
+				("ACLineStatus", ctypes.c_ubyte),
+				("BatteryFlag", ctypes.c_ubyte),
+				("BatteryLifePercent", ctypes.c_ubyte),
+				("SystemStatusFlag", ctypes.c_ubyte),
+				("BatteryLifeTime", wintypes.DWORD),
+				("BatteryFullLifeTime", wintypes.DWORD),
+			]
+
+		status = SYSTEM_POWER_STATUS()
+		if ctypes.windll.kernel32.GetSystemPowerStatus(ctypes.byref(status)) and status.ACLineStatus == 0:
+			return True  # 0 = offline (battery); 255 = unknown
+	except (OSError, AttributeError):
+		pass
+	return False
+
+
+def connect_once(signal, slot):
+	# UniqueConnection keeps a repeated setup from stacking duplicate slots
+	signal.connect(slot, Qt.UniqueConnection)
+
+
+class TimerDisplay(QWidget):
+	# Paints the DD HH MM SS fields in one paintEvent. Each field is a cached
+	# QStaticText centered in an equal quarter of the width, matching the
+	# caption grid above; past two digits the days font shrinks to fit.
+	def __init__(self, font: QFont, spacing: int = 10, parent: QWidget | None = None):
+		super().__init__(parent)
+		self._font = font
+		self._days_font = font
+		self._days_fitted = False
+		self._spacing = spacing
+		self._fields = []
+		for _ in range(4):
+			text = QStaticText("00")
+			text.setTextFormat(Qt.PlainText)
+			text.prepare(QTransform(), font)
+			self._fields.append(text)
+		# Digit height never changes, so pin it and keep layouts out of the tick path
+		self.setFixedHeight(QFontMetrics(font).height() + 4)
+		self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+
+	def set_field(self, index: int, value: str):
+		text = self._fields[index]
+		if text.text() == value:
+			return
+		text.setText(value)
+		if index == 0:
+			self._days_fitted = False  # Font is re-fitted on the next paint
+		else:
+			text.prepare(QTransform(), self._font)
+		self.update(self._field_rect(index).toAlignedRect())
+
+	def resizeEvent(self, event):
+		self._days_fitted = False
+		super().resizeEvent(event)
+
+	def _fit_days(self):
+		if self._days_fitted:
+			return
+		self._days_fitted = True
+		column = self._field_rect(0).width()
+		days = self._fields[0]
+		days.prepare(QTransform(), self._font)
+		self._days_font = self._font
+		natural = days.size().width()
+		if natural <= column:
+			return
+		# Letter spacing is a fixed 2px per glyph and does not scale with the point size
+		tracking = self._font.letterSpacing() * len(days.text())
+		size = self._font.pointSizeF() * max(column - tracking, 1.0) / max(natural - tracking, 1.0)
+		font = QFont(self._font)
+		font.setPointSizeF(size)
+		days.prepare(QTransform(), font)
+		# Glyph advances are hinted, so trim until the prepared text really fits
+		while days.size().width() > column and size > 1.0:
+			size -= 0.5
+			font.setPointSizeF(size)
+			days.prepare(QTransform(), font)
+		self._days_font = font
+
+	def _field_rect(self, index: int) -> QRectF:
+		width = (self.width() - 3 * self._spacing) / 4
+		return QRectF(index * (width + self._spacing), 0, width, self.height())
+
+	def paintEvent(self, event):
+		self._fit_days()
+		painter = QPainter(self)
+		painter.setPen(self.palette().color(QPalette.WindowText))
+		for index, text in enumerate(self._fields):
+			rect = self._field_rect(index)
+			painter.setFont(self._days_font if index == 0 else self._font)
+			size = text.size()
+			painter.drawStaticText(
+				QPointF(rect.x() + (rect.width() - size.width()) / 2, rect.y() + (rect.height() - size.height()) / 2),
+				text,
+			)
+		painter.end()
+
+
 class MainWindow(QMainWindow):
-	def __init__(self, start_epoch: float, accent_pulse: bool = True, compact: bool = False):
+	def __init__(self, start_ns: int, accent_pulse: bool = True, compact: bool = False):
 		super().__init__()
-		self.start_epoch = start_epoch
+		self._start_ns = start_ns  # time.monotonic_ns() baseline, offset already applied
 		self.accent_pulse = accent_pulse
 		self._pulse_direction = 1
 		self._pulse_value = 0
+		# One palette per pulse step, built once and indexed from _pulse.
+		# Palette changes repaint without touching QSS or an offscreen effect.
+		self._pulse_palettes = []
+		for i in range(41):
+			pulse_palette = QPalette()
+			pulse_palette.setColor(QPalette.WindowText, QColor(255, 255, 255 - i))
+			self._pulse_palettes.append(pulse_palette)
+		self._timers_initialized = False
+		self._about_box = None  # Lazily built in show_about
 		self.setWindowTitle(APP_TITLE)
 		self.setFixedSize(520 if not compact else 400, 260 if not compact else 180)
 		self._build_ui(compact)
@@ -87,40 +267,29 @@ class MainWindow(QMainWindow):
 		main_layout.setContentsMargins(28, 24, 28, 16)
 		main_layout.setSpacing(12)
 
-		# Grid-like horizontal layout for time units
-		units_row = QHBoxLayout()
-		units_row.setSpacing(10)
+		# Captions on row 0; all four numbers are painted by one widget on row 1
+		units_grid = QGridLayout()
+		units_grid.setHorizontalSpacing(10)
+		units_grid.setVerticalSpacing(2)
 
 		big_font = QFont("Segoe UI", 50 if not compact else 38, QFont.Bold)
+		big_font.setLetterSpacing(QFont.AbsoluteSpacing, 2)
 		caption_font = QFont("Segoe UI", 11 if not compact else 10, QFont.Medium)
 
-		self._number_labels = []  # For pulse + updates
-
-		def make_unit(title: str) -> QLabel:
-			wrapper = QVBoxLayout()
-			wrapper.setSpacing(2)
+		for col, title in enumerate(("DAYS", "HOURS", "MINUTES", "SECONDS")):
 			cap = QLabel(title)
 			cap.setAlignment(Qt.AlignCenter)
 			cap.setFont(caption_font)
 			cap.setObjectName("CaptionLabel")
-			num = QLabel("00")
-			num.setAlignment(Qt.AlignCenter)
-			num.setFont(big_font)
-			num.setObjectName("NumberLabel")
-			self._number_labels.append(num)
-			wrapper.addWidget(cap)
-			wrapper.addWidget(num)
-			container = QWidget()
-			container.setLayout(wrapper)
-			units_row.addWidget(container, 1)
-			return num
-
-		self.days_label = make_unit("DAYS")
-		self.hours_label = make_unit("HOURS")
-		self.minutes_label = make_unit("MINUTES")
-		self.seconds_label = make_unit("SECONDS")
-
-		main_layout.addLayout(units_row)
+			cap.setTextFormat(Qt.PlainText)
+			units_grid.addWidget(cap, 0, col)
+			units_grid.setColumnStretch(col, 1)
+
+		self._display = TimerDisplay(big_font, spacing=units_grid.horizontalSpacing())
+		self._display.setPalette(self._pulse_palettes[0])
+		units_grid.addWidget(self._display, 1, 0, 1, 4)
+
+		main_layout.addLayout(units_grid)
 
 		# Control buttons row
 		btn_row = QHBoxLayout()
@@ -128,18 +297,18 @@ class MainWindow(QMainWindow):
 		btn_row.addStretch(1)
 
 		self.minimize_btn = QPushButton("Hide to Tray")
-		self.minimize_btn.clicked.connect(self.minimize_to_tray)
+		connect_once(self.minimize_btn.clicked, self.minimize_to_tray)
 		self.minimize_btn.setCursor(Qt.PointingHandCursor)
 		btn_row.addWidget(self.minimize_btn)
 
 		self.always_on_top_btn = QPushButton("Stay On Top")
 		self.always_on_top_btn.setCheckable(True)
-		self.always_on_top_btn.clicked.connect(self.toggle_on_top)
+		connect_once(self.always_on_top_btn.clicked, self.toggle_on_top)
 		self.always_on_top_btn.setCursor(Qt.PointingHandCursor)
 		btn_row.addWidget(self.always_on_top_btn)
 
 		info_btn = QPushButton("About")
-		info_btn.clicked.connect(self.show_about)
+		connect_once(info_btn.clicked, self.show_about)
 		info_btn.setCursor(Qt.PointingHandCursor)
 		btn_row.addWidget(info_btn)
 
@@ -152,10 +321,7 @@ class MainWindow(QMainWindow):
 		self._setup_system_tray()
 
 		# Shortcuts
-		self.minimize_action = QAction("Hide to Tray", self)
-		self.minimize_action.setShortcut("H")
-		self.minimize_action.triggered.connect(self.minimize_to_tray)
-		self.addAction(self.minimize_action)
+		self.minimize_shortcut = QShortcut(QKeySequence("H"), self, activated=self.minimize_to_tray)
 
 	# Styling ----------------------------------------------------------
 	def _apply_styles(self):
@@ -176,59 +342,102 @@ class MainWindow(QMainWindow):
 		palette.setColor(QPalette.HighlightedText, QColor(255, 255, 255))
 		self.setPalette(palette)
 
-		self.setStyleSheet(
-			"""
-			QMainWindow { background: #121214; }
-			QLabel#NumberLabel { color: #FFFFFF; letter-spacing: 2px; }
-			QLabel#CaptionLabel { color: #8b9199; font-size: 11px; letter-spacing: 1px; }
-			QPushButton { background: #1c1f24; color: #e2e5e9; padding: 8px 14px; border: 1px solid #2c313a; border-radius: 6px; font-size: 14px; }
-			QPushButton:hover { background: #2a2f35; }
-			QPushButton:pressed { background: #23272d; }
-			QPushButton:checked { background: #347edb; border-color: #347edb; color: white; }
-			QPushButton:focus { outline: none; border: 1px solid #347edb; }
-			"""
-		)
-
 	# Timers -----------------------------------------------------------
 	def _init_timers(self):
-		# Main update timer
-		self.update_timer = QTimer(self)
-		self.update_timer.timeout.connect(self._update)
-		self.update_timer.start(1000)
-
-		# Accent pulse timer (subtle)
-		if self.accent_pulse:
-			self.pulse_timer = QTimer(self)
-			self.pulse_timer.timeout.connect(self._pulse)
-			self.pulse_timer.start(120)
+		if self._timers_initialized:
+			return
+		self._timers_initialized = True
+		# Single tick drives both the clock and the accent pulse; the clock
+		# labels are only touched when the elapsed second actually changes.
+		self._last_s = None
+		self._backgrounded = False  # Minimized or hidden to tray
+		# Last displayed (days, hours, minutes, secs); None so negative offsets still render
+		self._prev = (None, None, None, None)
+		self.tick_timer = QTimer(self)
+		connect_once(self.tick_timer.timeout, self._tick)
+		self._apply_tick_interval()
+
+	def _tick_interval(self) -> int:
+		if self._backgrounded:
+			return 5000  # Nobody is watching; just keep the title roughly current
+		return 120 if self.accent_pulse else 1000
+
+	def _apply_tick_interval(self):
+		interval = self._tick_interval()
+		# Clock-only ticks are one-shot and re-armed from _tick so each lands on
+		# the next second boundary instead of drifting up to a second behind.
+		aligned = interval == 1000
+		self.tick_timer.setSingleShot(aligned)
+		# Background ticks let the OS coalesce wakeups; the pulse only needs
+		# coarse (~5%) accuracy. Timer type takes effect on (re)start.
+		if aligned:
+			self.tick_timer.setTimerType(Qt.PreciseTimer)
 		else:
-			self.pulse_timer = None
+			self.tick_timer.setTimerType(Qt.VeryCoarseTimer if interval >= 1000 else Qt.CoarseTimer)
+		self.tick_timer.start(self._ms_to_next_second() if aligned else interval)
+
+	def _ms_to_next_second(self) -> int:
+		return 1000 - (time.monotonic_ns() - self._start_ns) // 1_000_000 % 1000
+
+	def _set_backgrounded(self, backgrounded: bool):
+		if backgrounded == self._backgrounded:
+			return
+		self._backgrounded = backgrounded
+		self._apply_tick_interval()
+		if not backgrounded:
+			self._tick()  # Re-sync labels immediately instead of waiting a tick
+
+	def _tick(self):
+		now_s = (time.monotonic_ns() - self._start_ns) // 1_000_000_000
+		if now_s != self._last_s:
+			self._last_s = now_s
+			self._update(now_s)
+		if self.accent_pulse and not self._backgrounded:
+			self._pulse()
+		if self.tick_timer.isSingleShot():
+			self.tick_timer.start(self._ms_to_next_second())
 
 	# Core Update ------------------------------------------------------
-	def _update(self):
-		elapsed = int(time.time() - self.start_epoch)
+	def _update(self, elapsed: int):
 		days, rem = divmod(elapsed, 86400)
 		hours, rem = divmod(rem, 3600)
 		minutes, secs = divmod(rem, 60)
-		self.days_label.setText(f"{days:02d}")
-		self.hours_label.setText(f"{hours:02d}")
-		self.minutes_label.setText(f"{minutes:02d}")
-		self.seconds_label.setText(f"{secs:02d}")
-		self.setWindowTitle(f"{APP_TITLE}  |  {days:02d}:{hours:02d}:{minutes:02d}:{secs:02d}")
+		prev_days, prev_hours, prev_minutes, _ = self._prev
+		# Only touch the fields whose value actually changed
+		if days != prev_days:
+			self._display.set_field(0, _TWO_DIGIT[days] if 0 <= days < 100 else str(days))
+		if hours != prev_hours:
+			self._display.set_field(1, _TWO_DIGIT[hours])
+		if minutes != prev_minutes:
+			self._display.set_field(2, _TWO_DIGIT[minutes])
+			# Title is a window-manager round-trip; refresh it once a minute
+			self.setWindowTitle(f"{APP_TITLE}  |  {format_duration(elapsed)[:-3]}")
+		self._display.set_field(3, _TWO_DIGIT[secs])
+		self._prev = (days, hours, minutes, secs)
 
 	# Pulse effect -----------------------------------------------------
 	def _pulse(self):
-		# Animate a slight accent glow across all number labels.
+		# Animate a slight accent glow across the timer digits.
 		self._pulse_value += self._pulse_direction
 		if self._pulse_value >= 40:
 			self._pulse_direction = -1
 		elif self._pulse_value <= 0:
 			self._pulse_direction = 1
-		base = 255
-		blue = 255 - self._pulse_value
-		color = f"rgb({base},{base},{blue})"
-		for lbl in self._number_labels:
-			lbl.setStyleSheet(f"color: {color}; letter-spacing: 2px;")
+		self._display.setPalette(self._pulse_palettes[self._pulse_value])
+
+	# Visibility -------------------------------------------------------
+	def changeEvent(self, event):
+		if event.type() == QEvent.WindowStateChange:
+			self._set_backgrounded(bool(self.windowState() & Qt.WindowMinimized))
+		super().changeEvent(event)
+
+	def hideEvent(self, event):
+		self._set_backgrounded(True)
+		super().hideEvent(event)
+
+	def showEvent(self, event):
+		self._set_backgrounded(bool(self.windowState() & Qt.WindowMinimized))
+		super().showEvent(event)
 
 	# System Tray Setup -----------------------------------------------
 	def _setup_system_tray(self):
@@ -241,15 +450,16 @@ class MainWindow(QMainWindow):
 		self.tray_icon.setToolTip(APP_TITLE)
 
 		# Create tray menu
+		from PySide6.QtWidgets import QMenu
 		tray_menu = QMenu()
 		show_action = tray_menu.addAction("Show")
-		show_action.triggered.connect(self.show_from_tray)
+		connect_once(show_action.triggered, self.show_from_tray)
 		tray_menu.addSeparator()
 		quit_action = tray_menu.addAction("Exit")
 		quit_action.triggered.connect(QApplication.quit)
 
 		self.tray_icon.setContextMenu(tray_menu)
-		self.tray_icon.activated.connect(self._on_tray_activated)
+		connect_once(self.tray_icon.activated, self._on_tray_activated)
 		self.tray_icon.show()
 
 	# Actions ----------------------------------------------------------
@@ -276,40 +486,53 @@ class MainWindow(QMainWindow):
 			self.show_from_tray()
 
 	def toggle_on_top(self):
-		if self.always_on_top_btn.isChecked():
-			self.setWindowFlag(Qt.WindowStaysOnTopHint, True)
-			self.always_on_top_btn.setText("On Top ✓")
+		on_top = self.always_on_top_btn.isChecked()
+		flags = self.windowFlags()
+		flags = (flags | Qt.WindowStaysOnTopHint) if on_top else (flags & ~Qt.WindowStaysOnTopHint)
+		handle = self.windowHandle()
+		if handle is not None:
+			# Update the native window in place; setWindowFlags would recreate it (flicker)
+			self.overrideWindowFlags(flags)
+			handle.setFlags(flags)
 		else:
-			self.setWindowFlag(Qt.WindowStaysOnTopHint, False)
-			self.always_on_top_btn.setText("Stay On Top")
-		self.show()  # Re-apply flags
+			self.setWindowFlags(flags)
+			self.show()  # Re-apply flags
+		self.always_on_top_btn.setText("On Top ✓" if on_top else "Stay On Top")
 
 	def show_about(self):
-		QMessageBox.information(
-			self,
-			"About",
-			(
-				f"{APP_TITLE}\n\n"
-				"A lightweight placeholder you can run instead of a game so Steam \n"
-				"continues counting playtime. Displays an on-going DD:HH:MM:SS timer.\n\n"
-				"Created for CodeKokeshi.\n"
-				"GitHub: https://github.com/CodeKokeshi/\n"
-				"itch.io: https://codekokeshi.itch.io/\n\n"
-				"No networking, no injection, no data collection—just a clock.\n"
-				"Please respect platform Terms of Service."
-			),
-		)
+		# Built on first use and reused, so the styled dialog is only polished once
+		if self._about_box is None:
+			from PySide6.QtWidgets import QMessageBox
+			self._about_box = QMessageBox(
+				QMessageBox.Information,
+				"About",
+				(
+					f"{APP_TITLE}\n\n"
+					"A lightweight placeholder you can run instead of a game so Steam \n"
+					"continues counting playtime. Displays an on-going DD:HH:MM:SS timer.\n\n"
+					"Created for CodeKokeshi.\n"
+					"GitHub: https://github.com/CodeKokeshi/\n"
+					"itch.io: https://codekokeshi.itch.io/\n\n"
+					"No networking, no injection, no data collection—just a clock.\n"
+					"Please respect platform Terms of Service."
+				),
+				QMessageBox.Ok,
+				self,
+			)
+		self._about_box.exec()
 
 
 def main():
 	args = parse_args()
 	offset_total = args.offset_seconds + int(args.offset_hours * 3600)
-	# Start epoch goes backwards by offset for display
-	start_epoch = time.time() - offset_total
+	# Monotonic baseline goes backwards by offset for display; immune to wall-clock jumps
+	start_ns = time.monotonic_ns() - offset_total * 1_000_000_000
 
 	app = QApplication(sys.argv)
 	app.setApplicationName(APP_TITLE)
-	window = MainWindow(start_epoch=start_epoch, accent_pulse=not args.no_accent_pulse, compact=args.compact)
+	app.setStyleSheet(STYLE_SHEET)
+	accent_pulse = not args.no_accent_pulse and not pulse_suppressed_by_system()
+	window = MainWindow(start_ns=start_ns, accent_pulse=accent_pulse, compact=args.compact)
 	window.show()
 	sys.exit(app.exec())
 